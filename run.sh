@@ -118,7 +118,7 @@ source ../$VENV_NAME/bin/activate
 
 # Install additional packages for WiFi simulation if needed
 echo "Installing/updating packages for WiFi simulation..."
-pip install pandas matplotlib tqdm numpy
+pip install pandas matplotlib tqdm numpy pyarrow
 
 # Navigate to NS3 build directory
 echo "Navigating to ns3.44 directory..."
@@ -181,8 +181,8 @@ if [ -d "$EXAMPLE_DIR" ] && [ -f "$EXAMPLE_DIR/wifi_analysis_and_control.py" ];
         if [[ "$response" =~ ^[Yy]$ ]]; then
             echo "Generating WiFi network visualization..."
             python3 wifi_network_visualization.py
-            if [ -f "sta_animation.gif" ]; then
-                echo "Animation saved as sta_animation.gif"
+            if [ -f "sta_animation.mp4" ]; then
+                echo "Animation saved as sta_animation.mp4"
             fi
         fi
     else
@@ -211,7 +211,8 @@ echo "- Data exported for visualization and further analysis"
 echo ""
 echo "Files generated in contrib/ai/examples/wifi-simulation/:"
 echo "- toy_data.csv: Complete WiFi network performance dataset"
-echo "- sta_animation.gif: Network topology animation (if generated)"
+echo "- toy_data.feather: Same dataset in columnar Feather format (if pyarrow is installed)"
+echo "- sta_animation.mp4: Network topology animation (if generated)"
 echo ""
 echo "Next steps:"
 echo "- Analyze toy_data.csv for network performance insights"
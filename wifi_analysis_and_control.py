@@ -36,7 +36,7 @@ Key Features:
 """
 
 # Data analysis and processing libraries
-import pandas as pd
+import numpy as np
 
 # Import the compiled Python binding module (created from wifi_python_bindings.cc)
 import ns3ai_wifi_py as py_binding
@@ -45,21 +45,179 @@ import ns3ai_wifi_py as py_binding
 import sys
 import traceback
 import os
+import logging
+import csv
 
 # Import NS3-AI utilities for experiment management
 from ns3ai_utils import Experiment
 
+# Optional Arrow writers for the CSV and Feather exports (csv module is the fallback)
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+except ImportError:
+    pa = None
+
+
+# Per-message logging, silent unless LOGLEVEL=DEBUG is set in the environment
+logging.basicConfig(format="python: %(message)s")
+log = logging.getLogger(__name__)
+log.setLevel(os.environ.get("LOGLEVEL", "WARNING").upper())
+
 print("python: WiFi Network Simulation - Python Analysis Started")
 
+
+# === ADAPTIVE CONTROL POLICY ===
+def _aptx_for(prev_mean_dl):
+    """
+    Map the mean DL throughput (Mbps) of the previous period to an AP Tx power (dBm):
+    - Example adaptive algorithm
+    - Higher throughput -> reduce power (less interference)
+    - Lower throughput -> maintain/increase power
+    """
+    return max(1.0, min(30.0, 30.0 - 30.0 * prev_mean_dl / 100.0))
+
+
+# === SHARED MEMORY RECORD LAYOUT ===
+"""
+NumPy view of one EnvStruct record (see wifi_data_structures.h):
+- Field order and C alignment must match the C++ struct exactly
+- GetCpp2PyBatch() exposes env_stas[0:n_stas] as contiguous records
+"""
+STA_DTYPE = np.dtype(
+    [
+        ("pos_x", np.float64),
+        ("pos_y", np.float64),
+        ("distance", np.float64),
+        ("dl_tp", np.float64),
+        ("ul_tp", np.float64),
+        ("get_ApTx", np.float64),
+        ("sta_id", np.int32),
+        ("now_sec", np.float64),
+    ],
+    align=True,
+)
+
+
+# === EXPORTED COLUMNS ===
+"""
+Column order and dtypes of the exported CSV/Feather data:
+- float32 is ample for positions, throughput and Tx power
+- sta_id is int32; time stays float64 for exact per-period grouping
+"""
+EXPORT_DTYPES = {
+    "pos_x": np.dtype(np.float32),
+    "pos_y": np.dtype(np.float32),
+    "distance": np.dtype(np.float32),
+    "dl_tp": np.dtype(np.float32),
+    "ul_tp": np.dtype(np.float32),
+    "get_ApTx": np.dtype(np.float32),
+    "sta_id": np.dtype(np.int32),
+    "now_sec": np.dtype(np.float64),
+    "set_ApTx": np.dtype(np.float32),
+}
+
+
+def _export_columns(rows, set_ApTx):
+    """Convert one STA_DTYPE batch to typed export columns, one cast per field"""
+    columns = {}
+    for field, dtype in EXPORT_DTYPES.items():
+        if field == "set_ApTx":
+            columns[field] = np.full(len(rows), set_ApTx, dtype=dtype)
+        else:
+            columns[field] = rows[field].astype(dtype)
+    return columns
+
+
+# === RUN SUMMARY ===
+class RunSummary:
+    """
+    Constant-memory summary of the collected measurements:
+    - Running count, min/max and sums updated once per report
+    - Rows themselves are only kept by the streamed export files
+    """
+
+    def __init__(self):
+        self.n = 0  # Number of measurements seen
+        self.now_min = np.inf
+        self.now_max = -np.inf
+        self.dl_sum = 0.0
+        self.ul_sum = 0.0
+        self.distance_min = np.inf
+        self.distance_max = -np.inf
+
+    def __len__(self):
+        return self.n
+
+    def update(self, columns):
+        self.n += len(columns["now_sec"])
+        self.now_min = min(self.now_min, float(columns["now_sec"].min()))
+        self.now_max = max(self.now_max, float(columns["now_sec"].max()))
+        self.dl_sum += float(columns["dl_tp"].sum(dtype=np.float64))
+        self.ul_sum += float(columns["ul_tp"].sum(dtype=np.float64))
+        self.distance_min = min(self.distance_min, float(columns["distance"].min()))
+        self.distance_max = max(self.distance_max, float(columns["distance"].max()))
+
+
+# === STREAMING DATA EXPORT ===
+class ExportStream:
+    """
+    Incremental CSV and Feather writer for the collected measurements:
+    - Files opened once, CSV header written before the first report
+    - Rows of every report appended as soon as they arrive
+    - CSV flushed per report, so data received before a crash is on disk
+    - Feather (Arrow IPC file) written only when pyarrow is available, to a
+      temporary path that replaces feather_path once the file is complete
+    """
+
+    def __init__(self, csv_path, feather_path, dtypes):
+        if pa is not None:
+            # Arrow formats the NumPy columns in C++, zero-copy, into a binary sink
+            self.schema = pa.schema(
+                [(name, pa.from_numpy_dtype(dtype)) for name, dtype in dtypes.items()]
+            )
+            self.fh = open(csv_path, "wb", buffering=1 << 20)
+            self.writer = pa_csv.CSVWriter(self.fh, self.schema)
+            # The IPC footer is only written on close; a killed run must not leave
+            # a truncated file at feather_path for the visualizer to prefer
+            self.feather_path = feather_path
+            self.feather_tmp_path = feather_path + ".tmp"
+            self.feather_writer = pa.ipc.new_file(self.feather_tmp_path, self.schema)
+        else:
+            self.fh = open(csv_path, "w", newline="", buffering=1 << 20)
+            self.writer = csv.writer(self.fh)
+            self.writer.writerow(dtypes)
+
+    def write(self, columns):
+        if pa is not None:
+            batch = pa.RecordBatch.from_pydict(columns, schema=self.schema)
+            self.writer.write_batch(batch)
+            self.feather_writer.write_batch(batch)
+        else:
+            self.writer.writerows(zip(*columns.values()))
+        self.fh.flush()
+
+    def close(self):
+        if pa is not None:
+            self.writer.close()
+        self.fh.close()
+        # Closed after the CSV, so the Feather file is never older than it
+        if pa is not None:
+            self.feather_writer.close()
+            os.replace(self.feather_tmp_path, self.feather_path)
+
+
 # === FILE SYSTEM SETUP ===
 """
 Setup data export path for simulation results:
 - Get the current script directory for relative file paths
 - Create CSV file path for exporting network performance data
+- Create Feather file path for the typed columnar copy read by the visualizer
 - Ensures data is saved in the same directory as the script
 """
 script_dir = os.path.dirname(os.path.abspath(__file__))
 csv_path = os.path.join(script_dir, "toy_data.csv")
+feather_path = os.path.join(script_dir, "toy_data.feather")
 
 # === EXPERIMENT INITIALIZATION ===
 """
@@ -68,8 +226,17 @@ Create an Experiment object to manage NS3-Python WiFi simulation communication:
 - ".": Working directory relative to examples directory
 - py_binding: Our compiled Python binding module for WiFi data structures
 - handleFinish=True: Automatically handle simulation finish signals
+- shmSize: Shared memory segment sized for one full STA batch, plus headroom for
+  the action struct and the segment's own bookkeeping
 """
-exp = Experiment("ns3ai_wifi_simulation", "../../../../", py_binding, handleFinish=True)
+shm_size = py_binding.ENV_BATCH_SIZE + 4096
+exp = Experiment(
+    "ns3ai_wifi_simulation",
+    "../../../../",
+    py_binding,
+    handleFinish=True,
+    shmSize=shm_size,
+)
 print("python: Calling the NS3 WiFi simulation script")
 
 # Start the NS3 WiFi simulation and get the message interface
@@ -78,52 +245,47 @@ msgInterface = exp.run(show_output=True)
 # === DATA COLLECTION SETUP ===
 """
 Initialize data structures for network performance analysis:
-- data_store: List to accumulate all WiFi network measurements
+- summary: Running statistics of all WiFi network measurements (constant memory)
+- export_stream: CSV and Feather export, written report by report
 - prev_now_sec: Track simulation time for change detection
-- current_dl_values: Buffer for current downlink throughput values
-- prev_mean_dl: Previous mean downlink throughput for comparison
+- dl_sum/dl_count: Running downlink throughput total of the current period
+- set_ApTx: Control decision, recomputed once per period from its mean downlink
 """
-data_store = []  # Master data collection list
+summary = RunSummary()  # End-of-run statistics
+# Streamed CSV/Feather export
+export_stream = ExportStream(csv_path, feather_path, EXPORT_DTYPES)
 prev_now_sec = -1.0  # Previous simulation timestamp
-current_dl_values = []  # Current downlink throughput buffer
-prev_mean_dl = None  # Previous mean downlink for adaptive control
+dl_sum = 0.0  # Current downlink throughput total
+dl_count = 0  # Current downlink sample count
+set_ApTx = 20.0  # Default transmission power (dBm) until a period mean is known
 
 # === MAIN COMMUNICATION AND ANALYSIS LOOP ===
 try:
     while True:
-        print("python: Starting WiFi data reception...")
-
-        # === RECEIVE PHASE: Get WiFi network data from C++ ===
+        # === RECEIVE PHASE: Get WiFi network data of all STAs from C++ ===
         msgInterface.PyRecvBegin()  # Lock shared memory and wait for C++ data
 
-        # Check if WiFi simulation has finished
-        print("python: WiFi simulation status:", msgInterface.PyGetFinished())
-        if msgInterface.PyGetFinished():
+        # Check if WiFi simulation has finished (one binding call per report)
+        finished = msgInterface.PyGetFinished()
+        log.debug("WiFi simulation status: %s", finished)
+        if finished:
             break  # Exit loop when C++ simulation is complete
 
         # === READ WIFI NETWORK DATA ===
         """
-        Extract current WiFi network state from shared memory:
+        Extract current WiFi network state of every station from shared memory:
+        - One STA_DTYPE record per station, all from the same report
         - Station position coordinates (pos_x, pos_y)
         - Network performance metrics (dl_tp, ul_tp)
         - Distance from station to access point
         - Current transmission parameters (get_ApTx)
         - Station ID and simulation timestamp
+        - Copied out before PyRecvEnd, since the view points into shared memory
         """
-        wifi_data = msgInterface.GetCpp2PyStruct()
-
-        # Extract individual WiFi network parameters
-        pos_x = wifi_data.pos_x  # Station X position (meters)
-        pos_y = wifi_data.pos_y  # Station Y position (meters)
-        distance = wifi_data.distance  # Distance to AP (meters)
-        dl_tp = wifi_data.dl_tp  # Downlink throughput (Mbps)
-        ul_tp = wifi_data.ul_tp  # Uplink throughput (Mbps)
-        get_ApTx = wifi_data.get_ApTx  # Current AP transmission parameter
-        sta_id = wifi_data.sta_id  # Station identifier
-        now_sec = wifi_data.now_sec  # Current simulation time
+        rows = np.frombuffer(msgInterface.GetCpp2PyBatch(), dtype=STA_DTYPE).copy()
+        now_sec = float(rows["now_sec"][0])  # Report time shared by the batch
 
         msgInterface.PyRecvEnd()  # Unlock shared memory, signal C++ we're done reading
-        print("python: WiFi data received successfully.")
 
         # === DATA PROCESSING AND ANALYSIS ===
         """
@@ -142,67 +304,66 @@ try:
         - Example: reduce power when throughput is high (less interference)
         """
 
-        # Initialize control parameter with current value
-        set_ApTx = 20.0  # Default transmission power (dBm)
-
         # Time-based analysis for adaptive control
         if now_sec != prev_now_sec:
             # Calculate mean DL throughput for previous timestamp period
-            if current_dl_values:
-                prev_mean_dl = sum(current_dl_values) / len(current_dl_values)
-                print(f"python: Mean DL @ {prev_now_sec:.2f}s: {prev_mean_dl:.2f} Mbps")
+            if dl_count:
+                prev_mean_dl = dl_sum / dl_count
+                log.debug("Mean DL @ %.2fs: %.2f Mbps", prev_now_sec, prev_mean_dl)
+
+                # One decision per period, reused until the next rollover
+                set_ApTx = _aptx_for(prev_mean_dl)
+                log.debug("Adaptive control - ApTx set to: %.2f dBm", set_ApTx)
 
             # Reset for new timestamp period
             prev_now_sec = now_sec
-            current_dl_values = []
-
-        # Accumulate current measurement
-        current_dl_values.append(dl_tp)
+            dl_sum = 0.0
+            dl_count = 0
 
-        # Adaptive transmission power control based on historical performance
-        if prev_mean_dl is not None:
-            # Example adaptive algorithm:
-            # Higher throughput -> reduce power (less interference)
-            # Lower throughput -> maintain/increase power
-            set_ApTx = max(1.0, min(30.0, 30.0 - 30.0 * prev_mean_dl / 100.0))
-            print(f"python: Adaptive control - ApTx set to: {set_ApTx:.2f} dBm")
+        # Accumulate current measurements into the period total
+        dl_sum += float(rows["dl_tp"].sum())
+        dl_count += len(rows)
 
         # === COMPREHENSIVE DATA LOGGING ===
-        print(
-            f"python: WiFi Status - "
-            f"time={now_sec:.5f} "
-            f"STA_ID={sta_id} "
-            f"Position=({pos_x:.5f},{pos_y:.5f}) "
-            f"Distance={distance:.5f}m "
-            f"DL={dl_tp:.5f}Mbps "
-            f"UL={ul_tp:.5f}Mbps "
-            f"old_Tx={get_ApTx:.5f}dBm "
-            f"new_Tx={set_ApTx:.5f}dBm"
-        )
-
-        # Store comprehensive WiFi measurement data for analysis
-        data_point = {
-            "pos_x": pos_x,
-            "pos_y": pos_y,
-            "distance": distance,
-            "dl_tp": dl_tp,
-            "ul_tp": ul_tp,
-            "get_ApTx": get_ApTx,
-            "sta_id": sta_id,
-            "now_sec": now_sec,
-            "set_ApTx": set_ApTx,
-        }
-        data_store.append(data_point)
+        if log.isEnabledFor(logging.DEBUG):
+            # tolist() yields plain tuples in STA_DTYPE field order
+            for (
+                pos_x,
+                pos_y,
+                distance,
+                dl_tp,
+                ul_tp,
+                get_ApTx,
+                sta_id,
+                now_sec_sta,
+            ) in rows.tolist():
+                log.debug(
+                    "WiFi Status - time=%.5f STA_ID=%d Position=(%.5f,%.5f) "
+                    "Distance=%.5fm DL=%.5fMbps UL=%.5fMbps "
+                    "old_Tx=%.5fdBm new_Tx=%.5fdBm",
+                    now_sec_sta,
+                    sta_id,
+                    pos_x,
+                    pos_y,
+                    distance,
+                    dl_tp,
+                    ul_tp,
+                    get_ApTx,
+                    set_ApTx,
+                )
+
+        # Store comprehensive WiFi measurement data and stream it to CSV/Feather
+        columns = _export_columns(rows, set_ApTx)
+        summary.update(columns)
+        export_stream.write(columns)
 
         # === SEND PHASE: Return control commands to C++ ===
-        print("python: Sending adaptive control commands...")
         msgInterface.PySendBegin()  # Lock shared memory for writing control commands
 
         # Write the calculated control parameters to shared memory
         msgInterface.GetPy2CppStruct().set_ApTx = set_ApTx
 
         msgInterface.PySendEnd()  # Unlock shared memory, signal C++ that commands are ready
-        print("python: Control commands sent successfully.")
 
 # === ERROR HANDLING ===
 except Exception as e:
@@ -217,12 +378,9 @@ except Exception as e:
     print("python: Traceback:")
     traceback.print_tb(exc_traceback)
 
-    # Save collected data even if error occurs
-    if data_store:
-        print("python: Saving collected WiFi data before exit...")
-        df = pd.DataFrame(data_store)
-        df.to_csv(csv_path, index=False)
-        print(f"python: WiFi data saved to {csv_path}")
+    # Collected data was streamed to disk report by report
+    if summary:
+        print(f"python: WiFi data received before the error is in {csv_path}")
 
     exit(1)
 
@@ -230,7 +388,7 @@ except Exception as e:
 else:
     """
     Normal completion workflow:
-    - Save all collected WiFi network data to CSV
+    - All collected WiFi network data is already streamed to CSV/Feather
     - Provide summary statistics
     - Prepare data for visualization
     """
@@ -242,28 +400,29 @@ finally:
     Cleanup code that always executes:
     - Runs whether the script exits normally or with an error
     - Ensures proper cleanup of experiment resources
-    - Exports collected data to CSV for analysis
+    - Closes the streamed CSV and Feather exports
     - Provides final status and statistics
     """
     print("python: Cleaning up WiFi simulation resources...")
 
-    # Export collected data to CSV for analysis and visualization
-    if data_store:
-        df = pd.DataFrame(data_store)
-        df.to_csv(csv_path, index=False)
+    # Finish the CSV/Feather export used for analysis and visualization
+    export_stream.close()
+    if summary:
         print(f"python: WiFi network data exported to {csv_path}")
-        print(f"python: Total data points collected: {len(data_store)}")
+        if pa is not None:
+            print(f"python: WiFi network data exported to {feather_path}")
+        print(f"python: Total data points collected: {len(summary)}")
 
         # Provide summary statistics if data was collected
-        if len(data_store) > 0:
+        if len(summary) > 0:
             print(
-                f"python: Simulation duration: {max(df['now_sec']) - min(df['now_sec']):.2f} seconds"
+                f"python: Simulation duration: {summary.now_max - summary.now_min:.2f} seconds"
             )
             print(
-                f"python: Average throughput: DL={df['dl_tp'].mean():.2f} Mbps, UL={df['ul_tp'].mean():.2f} Mbps"
+                f"python: Average throughput: DL={summary.dl_sum / summary.n:.2f} Mbps, UL={summary.ul_sum / summary.n:.2f} Mbps"
             )
             print(
-                f"python: Distance range: {df['distance'].min():.2f}m - {df['distance'].max():.2f}m"
+                f"python: Distance range: {summary.distance_min:.2f}m - {summary.distance_max:.2f}m"
             )
     else:
         print("python: No data collected during simulation.")
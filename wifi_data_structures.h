@@ -31,6 +31,9 @@
  * - Network throughput metrics (uplink/downlink)
  * - Access Point (AP) transmission parameters
  * - Real-time network performance data
+ *
+ * All STA samples of one report are sent to Python in a single batch
+ * (EnvBatchStruct) so that each report costs one shared-memory exchange.
  */
 
 #ifndef WIFI_DATA_STRUCTURES_H
@@ -38,13 +41,27 @@
 
 #include <cstdint>
 
+/**
+ * Maximum number of stations carried by one EnvBatchStruct.
+ * The simulation must not be configured with more STAs than this. The Python
+ * side sizes the NS3-AI shared memory segment from sizeof(EnvBatchStruct)
+ * (exported by the binding), so changing this value adjusts both together.
+ * Can be overridden at compile time with -DWIFI_MAX_STAS=<n>.
+ */
+#ifndef WIFI_MAX_STAS
+#define WIFI_MAX_STAS 256
+#endif
+
 /**
  * @struct EnvStruct
- * @brief Environment data structure (C++ → Python direction)
+ * @brief Per-station environment record (C++ → Python direction)
  *
  * Contains real-time WiFi network data generated by the NS3 simulation
  * that needs to be processed by Python for analysis and visualization.
  * This structure is written by C++ and read by Python.
+ *
+ * The memory layout is mirrored by STA_DTYPE in wifi_analysis_and_control.py,
+ * which reads batches of records as a NumPy structured array.
  */
 struct EnvStruct
 {
@@ -58,6 +75,21 @@ struct EnvStruct
     double env_now_sec;  ///< Current simulation time in seconds
 };
 
+static_assert(sizeof(EnvStruct) == 64, "EnvStruct layout must match STA_DTYPE in Python");
+
+/**
+ * @struct EnvBatchStruct
+ * @brief Batch of per-station records for one report (C++ → Python direction)
+ *
+ * Holds the EnvStruct records of every STA for a single reporting interval,
+ * so Python drains all of them in one PyRecvBegin/PyRecvEnd cycle.
+ */
+struct EnvBatchStruct
+{
+    uint32_t env_n_stas;               ///< Number of valid records in env_stas
+    EnvStruct env_stas[WIFI_MAX_STAS]; ///< Per-STA records, contiguous in memory
+};
+
 /**
  * @struct ActStruct
  * @brief Action data structure (Python → C++ direction)
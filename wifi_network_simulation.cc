@@ -31,7 +31,7 @@
  *
  * Communication Flow:
  * 1. C++ simulation generates WiFi network data
- * 2. Data sent to Python via NS3-AI shared memory
+ * 2. Data of all stations sent to Python in one batch via NS3-AI shared memory
  * 3. Python performs analysis and calculates adaptations
  * 4. Python sends control commands back to C++
  * 5. C++ applies adaptations to WiFi parameters
@@ -55,10 +55,12 @@
 #include "ns3/ai-module.h" // NS3-AI communication framework
 
 // === STANDARD C++ LIBRARIES ===
+#include <algorithm>
 #include <chrono>
 #include <cstdint>
 #include <iostream>
 #include <random>
+#include <vector>
 
 using namespace ns3;
 
@@ -97,11 +99,11 @@ NetDeviceContainer staDevices;                 // Station network devices
 // === NS3-AI COMMUNICATION INTERFACE ===
 /*
  * Message interface for bidirectional C++/Python communication:
- * - EnvStruct: WiFi environment data sent to Python
+ * - EnvBatchStruct: WiFi environment data of all STAs sent to Python
  * - ActStruct: Control actions received from Python
  * - Real-time shared memory communication
  */
-Ns3AiMsgInterfaceImpl<EnvStruct, ActStruct> *msgInterface; // AI message interface
+Ns3AiMsgInterfaceImpl<EnvBatchStruct, ActStruct> *msgInterface; // AI message interface
 
 // === NETWORK LAYER INTERFACES ===
 /*
@@ -124,31 +126,18 @@ uint32_t g_apPhyRxDrops = 0;             // AP PHY RX drop counter
 std::vector<Ptr<YansWifiPhy>> g_staPhys; // PHY pointers for stations
 Ptr<YansWifiPhy> g_apPhy;                // PHY pointer for AP
 
-// Exchanges information with Python AI via the message interface and returns the new AP Tx power
+// Sends the records of all STAs to Python AI in one message and returns the new AP Tx power
 double
-LetsTalk(Ns3AiMsgInterfaceImpl<EnvStruct, ActStruct> *msgInterface,
-         double pos_x,
-         double pos_y,
-         double distance,
-         double dl_tp,
-         double ul_tp,
-         int get_ApTx,
-         int sta_id,
-         double now_sec)
+LetsTalk(Ns3AiMsgInterfaceImpl<EnvBatchStruct, ActStruct> *msgInterface,
+         const std::vector<EnvStruct> &staRecords)
 {
     std::cout << "C++;LetsTalk: Starting sending msg.\n";
     msgInterface->CppSendBegin();
 
-    // Populate the shared struct with environment information
-    EnvStruct *env = msgInterface->GetCpp2PyStruct();
-    env->env_pos_x = pos_x;
-    env->env_pos_y = pos_y;
-    env->env_distance = distance;
-    env->env_dl_tp = dl_tp;
-    env->env_ul_tp = ul_tp;
-    env->env_get_ApTx = get_ApTx;
-    env->env_sta_id = sta_id;
-    env->env_now_sec = now_sec;
+    // Populate the shared batch with the environment information of every STA
+    EnvBatchStruct *batch = msgInterface->GetCpp2PyStruct();
+    batch->env_n_stas = staRecords.size();
+    std::copy(staRecords.begin(), staRecords.end(), batch->env_stas);
 
     msgInterface->CppSendEnd();
     std::cout << "C++;LetsTalk: Stopped sending msg.\n";
@@ -169,7 +158,7 @@ LetsTalk(Ns3AiMsgInterfaceImpl<EnvStruct, ActStruct> *msgInterface,
 }
 
 // Initializes the AI message interface for communication with Python
-Ns3AiMsgInterfaceImpl<EnvStruct, ActStruct> *
+Ns3AiMsgInterfaceImpl<EnvBatchStruct, ActStruct> *
 InitializeNs3AiInterface()
 {
     std::cout << "C++;InitializeNs3AiInterface: Initializing the interface.\n";
@@ -178,7 +167,7 @@ InitializeNs3AiInterface()
     interface->SetUseVector(false);       // Not using vectorized communication
     interface->SetHandleFinish(true);     // Handle finish signal
     std::cout << "C++;InitializeNs3AiInterface: The interface has been initialized.\n";
-    return interface->GetInterface<EnvStruct, ActStruct>();
+    return interface->GetInterface<EnvBatchStruct, ActStruct>();
 }
 
 // Reports throughput, distance, and energy for each STA and AP, and interacts with AI for AP Tx
@@ -228,6 +217,8 @@ void GetReport(Time interval)
     std::cout << "Total UL Throughput: " << ulThroughput << "Mbps\n";
 
     // For each STA, print position, distance to AP, downlink throughput, and energy info
+    std::vector<EnvStruct> staRecords;
+    staRecords.reserve(g_staServers.size());
     for (uint32_t i = 0; i < g_staServers.size(); ++i)
     {
         Ptr<WifiNetDevice> staDev = DynamicCast<WifiNetDevice>(staDevices.Get(i));
@@ -247,17 +238,17 @@ void GetReport(Time interval)
                   << " Distance: " << distance << "m"
                   << "\n  DL: " << dlThroughput << "Mbps\n";
 
-        // Interact with AI (Python) for new AP Tx power
-        new_txPower = LetsTalk(msgInterface,
-                               staPos.x,
-                               staPos.y,
-                               distance,
-                               dlThroughput,
-                               ulThroughput,
-                               old_txPower,
-                               i,
-                               nowSeconds);
-        std::cout << "C++;GetReport: Python Response TX: " << new_txPower << "\n";
+        // Queue the STA record for the batched exchange with AI (Python)
+        EnvStruct env;
+        env.env_pos_x = staPos.x;
+        env.env_pos_y = staPos.y;
+        env.env_distance = distance;
+        env.env_dl_tp = dlThroughput;
+        env.env_ul_tp = ulThroughput;
+        env.env_get_ApTx = static_cast<int>(old_txPower); // Reported in whole dBm
+        env.env_sta_id = i;
+        env.env_now_sec = nowSeconds;
+        staRecords.push_back(env);
 
         // Display station performance metrics
         std::cout << "   [Station " << i << "] "
@@ -267,11 +258,22 @@ void GetReport(Time interval)
                   << "UL: " << ulThroughput << "Mbps\n";
     }
 
-    // Set new AP Tx power using the global pointer (only once per report)
+    // Interact with AI (Python) once per report for new AP Tx power; with no STAs
+    // there is nothing to report and Python is not called
+    if (!staRecords.empty())
+    {
+        new_txPower = LetsTalk(msgInterface, staRecords);
+        std::cout << "C++;GetReport: Python Response TX: " << new_txPower << "\n";
+    }
+
+    // Set new AP Tx power using the global pointer (only once per report, only if changed)
     if (g_apPhy)
     {
-        g_apPhy->SetTxPowerStart(new_txPower);
-        g_apPhy->SetTxPowerEnd(new_txPower);
+        if (new_txPower != old_txPower)
+        {
+            g_apPhy->SetTxPowerStart(new_txPower);
+            g_apPhy->SetTxPowerEnd(new_txPower);
+        }
     }
     else
     {
@@ -290,6 +292,8 @@ void InitializeScenario()
 {
     using namespace ns3::energy;
     std::cout << "C++;InitializeScenario: Initializing the scenario.\n";
+    NS_ABORT_MSG_IF(g_nStas > WIFI_MAX_STAS,
+                    "g_nStas exceeds WIFI_MAX_STAS records per Python batch");
 
     // Create AP and STA nodes
     std::cout << "C++;InitializeScenario: Creating AP and STA nodes.\n";
@@ -36,7 +36,7 @@ Key Features:
 - Export capabilities for presentation/analysis
 
 Data Sources:
-- toy_data.csv: Simulation results from toy1.py
+- toy_data.feather / toy_data.csv: Simulation results from wifi_analysis_and_control.py
 - Real-time data during simulation (optional)
 - Network topology and performance metrics
 
@@ -55,23 +55,54 @@ import pandas as pd
 import numpy as np
 from tqdm import tqdm
 
+# Optional Datashader rasterizer for simulations with many stations
+try:
+    import datashader as ds
+    import datashader.transfer_functions as tf
+except ImportError:
+    ds = None
+
 # Standard libraries for file operations and system utilities
 import os
 import sys
 from datetime import datetime
 
+# Stations per frame from which STAs are rasterized instead of drawn as artists
+DATASHADER_MIN_STAS = 100
+
 print("WiFi Network Animation - Starting visualization setup...")
 
 # === FILE SYSTEM AND DATA LOADING ===
 """
 Setup data input paths and load simulation results:
-- Locate CSV data file from WiFi simulation
+- Locate Feather/CSV data file from WiFi simulation
+- Prefer the Feather copy (typed, columnar) unless it is older than the CSV
 - Load and validate simulation data
 - Prepare data structures for animation
 """
 script_dir = os.path.dirname(os.path.abspath(__file__))
 csv_path = os.path.join(script_dir, "toy_data.csv")
-df = pd.read_csv(csv_path)
+feather_path = os.path.join(script_dir, "toy_data.feather")
+if os.path.exists(feather_path) and (
+    not os.path.exists(csv_path)
+    or os.path.getmtime(feather_path) >= os.path.getmtime(csv_path)
+):
+    df = pd.read_feather(feather_path)
+else:
+    df = pd.read_csv(
+        csv_path,
+        dtype={
+            "pos_x": "float32",
+            "pos_y": "float32",
+            "distance": "float32",
+            "dl_tp": "float32",
+            "ul_tp": "float32",
+            "get_ApTx": "float32",
+            "sta_id": "int32",
+            "now_sec": "float64",
+            "set_ApTx": "float32",
+        },
+    )
 mlim = max(df["pos_x"].abs().max(), df["pos_y"].abs().max()) + 1
 
 # Create figure and axis
@@ -89,62 +120,110 @@ scat = ax.scatter(
     [], [], facecolors="none", edgecolors="blue", s=250, label="STA", linewidths=2
 )
 time_text = ax.text(0.05, 0.9, "", transform=ax.transAxes)
-annotations = []
-sta_texts = []
+
+# Per-frame data, grouped once instead of filtering the full table on every frame
+unique_times = np.sort(df["now_sec"].unique())
+groups = [group for _, group in df.groupby("now_sec", sort=True)]
+
+# Large frames are rasterized by Datashader instead of drawn as per-STA artists
+max_stas = max(len(group) for group in groups)
+use_datashader = ds is not None and max_stas >= DATASHADER_MIN_STAS
+if not use_datashader:
+    group_positions = [group[["pos_x", "pos_y"]].to_numpy() for group in groups]
+else:
+    canvas = ds.Canvas(
+        plot_width=800, plot_height=800, x_range=(-mlim, mlim), y_range=(-mlim, mlim)
+    )
+    raster = ax.imshow(
+        np.zeros((800, 800, 4), dtype=np.uint8), extent=(-mlim, mlim, -mlim, mlim)
+    )
+    print(f"Rendering {max_stas} STAs per frame with Datashader")
+
+# Text artists created once and moved every frame (STA numbers, annotation boxes)
+pool_size = 0 if use_datashader else max_stas
+sta_label_pool = [
+    ax.text(
+        0,
+        0,
+        "",
+        color="blue",
+        ha="center",
+        va="center",
+        fontsize=10,
+        fontweight="bold",
+        visible=False,
+    )
+    for _ in range(pool_size)
+]
+ann_pool = [
+    ax.text(
+        0,
+        0,
+        "",
+        bbox=dict(facecolor="white", alpha=0.8, boxstyle="round,pad=0.2"),
+        fontsize=9,
+        ha="left",
+        va="bottom",
+        visible=False,
+    )
+    for _ in range(pool_size)
+]
+
+# Artists changed by every frame, returned from init() and update()
+dynamic_artists = (scat, time_text, *sta_label_pool, *ann_pool)
+if use_datashader:
+    dynamic_artists = (raster,) + dynamic_artists
 
 
 def init():
     scat.set_offsets(np.empty((0, 2)))
     time_text.set_text("")
-    for txt in sta_texts:
-        txt.remove()
-    sta_texts.clear()
-    return scat, time_text
+    for txt in sta_label_pool + ann_pool:
+        txt.set_visible(False)
+    return dynamic_artists
 
 
 def update(frame):
-    current_time = df["now_sec"].unique()[frame]
-    current_data = df[df["now_sec"] == current_time]
-
-    # Update STA positions
-    scat.set_offsets(current_data[["pos_x", "pos_y"]].values)
-
-    # Clear previous elements
-    for ann in annotations:
-        ann.remove()
-    annotations.clear()
-
-    for txt in sta_texts:
-        txt.remove()
-    sta_texts.clear()
-
-    # Add STA numbers inside markers
-    for _, row in current_data.iterrows():
-        txt = ax.text(
-            row["pos_x"],
-            row["pos_y"],
-            str(int(row["sta_id"])),
-            color="blue",
-            ha="center",
-            va="center",
-            fontsize=10,
-            fontweight="bold",
-        )
-        sta_texts.append(txt)
-
-    # Create adjacent annotation boxes
-    for _, row in current_data.iterrows():
-        text = f"DL: {row['dl_tp']:.2f} Mbps\nDist: {row['distance']:.2f}m"
-        ann = ax.text(
-            row["pos_x"] + 0.01,  # Right offset
-            row["pos_y"] + 0.01,  # Upper offset
-            text,
-            bbox=dict(facecolor="white", alpha=0.8, boxstyle="round,pad=0.2"),
-            fontsize=9,
-            ha="left",
-            va="bottom",
-        )
-        annotations.append(ann)
+    current_time = unique_times[frame]
+    current_data = groups[frame]
+
+    if use_datashader:
+        # Rasterize all STAs of the frame, shaded by mean DL throughput per pixel
+        agg = canvas.points(current_data, "pos_x", "pos_y", ds.mean("dl_tp"))
+        img = tf.spread(tf.shade(agg, cmap=["lightblue", "darkblue"]), px=2)
+        raster.set_data(np.asarray(img.to_pil()))
+    else:
+        # Update STA positions
+        scat.set_offsets(group_positions[frame])
+
+        # Plain Python values per column instead of one boxed Series per row
+        xs = current_data["pos_x"].tolist()
+        ys = current_data["pos_y"].tolist()
+        ids = current_data["sta_id"].tolist()
+        dls = current_data["dl_tp"].tolist()
+        dists = current_data["distance"].tolist()
+
+        # Single pass per STA: number inside the marker and adjacent annotation box
+        for i, (x, y, sid, dl, dist) in enumerate(zip(xs, ys, ids, dls, dists)):
+            txt = sta_label_pool[i]
+            txt.set_position((x, y))
+            txt.set_text(str(sid))
+            txt.set_visible(True)
+
+            ann = ann_pool[i]
+            ann.set_position(
+                (
+                    x + 0.01,  # Right offset
+                    y + 0.01,  # Upper offset
+                )
+            )
+            ann.set_text(f"DL: {dl:.2f} Mbps\nDist: {dist:.2f}m")
+            ann.set_visible(True)
+
+        # Hide pooled artists not used in this frame
+        n_active = len(current_data)
+        for txt in sta_label_pool[n_active:] + ann_pool[n_active:]:
+            txt.set_visible(False)
 
     total_ul = current_data["ul_tp"].mean()
     total_dl = current_data["dl_tp"].sum()
@@ -156,17 +235,22 @@ def update(frame):
         f"Time: {current_time:.2f}s"
     )
 
-    return scat, time_text, *annotations, *sta_texts
+    return dynamic_artists
 
 
 # Animation setup
-frames = len(df["now_sec"].unique())
-pbar = tqdm(total=frames, desc="Rendering frames")
+frames = unique_times.size
+pbar = tqdm(
+    total=frames,
+    desc="Rendering frames",
+    mininterval=0.5,
+    miniters=max(1, frames // 100),
+)
 
 
 def progress_callback(current_frame, total_frames):
-    pbar.n = current_frame
-    pbar.refresh()
+    # update() lets tqdm throttle terminal redraws instead of forcing one per frame
+    pbar.update(current_frame - pbar.n)
 
 
 ani = animation.FuncAnimation(
@@ -179,11 +263,15 @@ ani = animation.FuncAnimation(
 )
 
 plt.legend()
+
+# H.264 through ffmpeg: multi-threaded encoding, no per-frame GIF palette work.
+# codec="h264" (libx264 in ffmpeg) makes Matplotlib add -pix_fmt yuv420p,
+# which common players need
+writer = animation.FFMpegWriter(fps=5, codec="h264", bitrate=1800)
 ani.save(
-    "sta_animation.gif",
-    writer="imagemagick",
-    fps=5,
+    "sta_animation.mp4",
+    writer=writer,
     progress_callback=progress_callback,
 )
 pbar.close()
-print("Animation saved to sta_animation.gif")
+print("Animation saved to sta_animation.mp4")
@@ -28,6 +28,7 @@
  *
  * Key components:
  * - EnvStruct binding for receiving WiFi network data from C++
+ * - EnvBatchStruct binding and zero-copy batch view of all STA records
  * - ActStruct binding for sending control commands to C++
  * - Message interface for synchronized data exchange
  */
@@ -54,6 +55,14 @@ namespace py = pybind11;
  */
 PYBIND11_MODULE(ns3ai_wifi_py, m)
 {
+    /**
+     * Batch limits shared with Python
+     * - WIFI_MAX_STAS: maximum STA records per EnvBatchStruct
+     * - ENV_BATCH_SIZE: bytes of one EnvBatchStruct, used to size shared memory
+     */
+    m.attr("WIFI_MAX_STAS") = WIFI_MAX_STAS;
+    m.attr("ENV_BATCH_SIZE") = sizeof(EnvBatchStruct);
+
     /**
      * Bind the EnvStruct C++ class to Python as "PyEnvStruct"
      * This structure contains WiFi network data sent FROM C++ TO Python
@@ -73,6 +82,16 @@ PYBIND11_MODULE(ns3ai_wifi_py, m)
         .def_readwrite("sta_id", &EnvStruct::env_sta_id)     // Station identifier
         .def_readwrite("now_sec", &EnvStruct::env_now_sec);  // Current simulation time
 
+    /**
+     * Bind the EnvBatchStruct C++ class to Python as "PyEnvBatchStruct"
+     * This structure carries the EnvStruct records of all STAs for one report
+     * - n_stas: number of valid records in the batch
+     * - Records are read in bulk through GetCpp2PyBatch()
+     */
+    py::class_<EnvBatchStruct>(m, "PyEnvBatchStruct")
+        .def(py::init<>())                                     // Default constructor
+        .def_readwrite("n_stas", &EnvBatchStruct::env_n_stas); // Number of STA records
+
     /**
      * Bind the ActStruct C++ class to Python as "PyActStruct"
      * This structure contains control commands sent FROM Python TO C++
@@ -86,9 +105,9 @@ PYBIND11_MODULE(ns3ai_wifi_py, m)
     /**
      * Bind the NS3 AI Message Interface to Python
      * This is the core communication interface for WiFi simulation data exchange
-     * Template parameters: <EnvStruct, ActStruct> specify the data structures used
+     * Template parameters: <EnvBatchStruct, ActStruct> specify the data structures used
      */
-    py::class_<ns3::Ns3AiMsgInterfaceImpl<EnvStruct, ActStruct>>(m, "Ns3AiMsgInterfaceImpl")
+    py::class_<ns3::Ns3AiMsgInterfaceImpl<EnvBatchStruct, ActStruct>>(m, "Ns3AiMsgInterfaceImpl")
         /**
          * Constructor binding with all parameters for shared memory communication:
          * @param bool: useVector - whether to use vector-based communication
@@ -116,52 +135,67 @@ PYBIND11_MODULE(ns3ai_wifi_py, m)
         /**
          * PyRecvBegin: Start receiving WiFi data from C++ simulation
          * Call this before reading network performance data
-         * Returns: Pointer to EnvStruct containing current WiFi network state
+         * Returns: Pointer to EnvBatchStruct containing current WiFi network state
          */
-        .def("PyRecvBegin", &ns3::Ns3AiMsgInterfaceImpl<EnvStruct, ActStruct>::PyRecvBegin)
+        .def("PyRecvBegin", &ns3::Ns3AiMsgInterfaceImpl<EnvBatchStruct, ActStruct>::PyRecvBegin)
 
         /**
          * PyRecvEnd: End receiving WiFi data from C++ simulation
          * Call this after finishing reading from shared memory
          * Signals to C++ that Python has finished processing current data
          */
-        .def("PyRecvEnd", &ns3::Ns3AiMsgInterfaceImpl<EnvStruct, ActStruct>::PyRecvEnd)
+        .def("PyRecvEnd", &ns3::Ns3AiMsgInterfaceImpl<EnvBatchStruct, ActStruct>::PyRecvEnd)
 
         /**
          * PySendBegin: Start sending control commands to C++ simulation
          * Call this before writing adaptive control parameters
          * Returns: Pointer to ActStruct for writing Python control decisions
          */
-        .def("PySendBegin", &ns3::Ns3AiMsgInterfaceImpl<EnvStruct, ActStruct>::PySendBegin)
+        .def("PySendBegin", &ns3::Ns3AiMsgInterfaceImpl<EnvBatchStruct, ActStruct>::PySendBegin)
 
         /**
          * PySendEnd: End sending control commands to C++ simulation
          * Call this after finishing writing control parameters
          * Signals to C++ that new control data is ready for application
          */
-        .def("PySendEnd", &ns3::Ns3AiMsgInterfaceImpl<EnvStruct, ActStruct>::PySendEnd)
+        .def("PySendEnd", &ns3::Ns3AiMsgInterfaceImpl<EnvBatchStruct, ActStruct>::PySendEnd)
 
         /**
          * PyGetFinished: Check if WiFi simulation has finished
          * Returns: bool indicating whether C++ simulation is complete
          */
-        .def("PyGetFinished", &ns3::Ns3AiMsgInterfaceImpl<EnvStruct, ActStruct>::PyGetFinished)
+        .def("PyGetFinished", &ns3::Ns3AiMsgInterfaceImpl<EnvBatchStruct, ActStruct>::PyGetFinished)
 
         /**
          * GetCpp2PyStruct: Get direct access to WiFi simulation data
-         * Returns: Reference to EnvStruct (WiFi data from C++ to Python)
+         * Returns: Reference to EnvBatchStruct (WiFi data from C++ to Python)
          * return_value_policy::reference: Return by reference (no copy)
          */
         .def("GetCpp2PyStruct",
-             &ns3::Ns3AiMsgInterfaceImpl<EnvStruct, ActStruct>::GetCpp2PyStruct,
+             &ns3::Ns3AiMsgInterfaceImpl<EnvBatchStruct, ActStruct>::GetCpp2PyStruct,
              py::return_value_policy::reference)
 
+        /**
+         * GetCpp2PyBatch: Get a read-only view of all STA records in the batch
+         * Returns: memoryview over env_stas[0:n_stas] in shared memory (no copy)
+         * Consume with np.frombuffer(..., dtype=STA_DTYPE) between
+         * PyRecvBegin and PyRecvEnd; copy the rows before PyRecvEnd
+         */
+        .def("GetCpp2PyBatch",
+             [](ns3::Ns3AiMsgInterfaceImpl<EnvBatchStruct, ActStruct> &self) {
+                 EnvBatchStruct *batch = self.GetCpp2PyStruct();
+                 return py::memoryview::from_memory(
+                     batch->env_stas,
+                     static_cast<py::ssize_t>(sizeof(EnvStruct) * batch->env_n_stas),
+                     true);
+             })
+
         /**
          * GetPy2CppStruct: Get direct access to control command structure
          * Returns: Reference to ActStruct (control commands from Python to C++)
          * return_value_policy::reference: Return by reference (no copy)
          */
         .def("GetPy2CppStruct",
-             &ns3::Ns3AiMsgInterfaceImpl<EnvStruct, ActStruct>::GetPy2CppStruct,
+             &ns3::Ns3AiMsgInterfaceImpl<EnvBatchStruct, ActStruct>::GetPy2CppStruct,
              py::return_value_policy::reference);
 }